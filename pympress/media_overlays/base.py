@@ -50,6 +50,12 @@ from pympress.util import IS_POSIX, IS_MAC_OS, IS_WINDOWS
 from pympress import builder
 
 
+#: ctypes prototype of PyCapsule_GetPointer, set up on the first call to :func:`get_window_handle`
+_PyCapsule_GetPointer = None
+#: ctypes prototype of gdk_win32_window_get_handle, set up on the first call to :func:`get_window_handle`
+_gdk_win32_window_get_handle = None
+
+
 def get_window_handle(window):
     """ Uses ctypes to call gdk_win32_window_get_handle which is not available
     in python gobject introspection porting (yet ?)
@@ -61,13 +67,23 @@ def get_window_handle(window):
     Returns:
         The handle to the win32 window
     """
+    global _PyCapsule_GetPointer, _gdk_win32_window_get_handle
+
+    if _gdk_win32_window_get_handle is None:
+        # Set up the ctypes prototypes once, rather than on every call
+        _PyCapsule_GetPointer = ctypes.pythonapi.PyCapsule_GetPointer
+        _PyCapsule_GetPointer.restype = ctypes.c_void_p
+        _PyCapsule_GetPointer.argtypes = [ctypes.py_object, ctypes.c_void_p]
+
+        gdk_win32_window_get_handle = ctypes.CDLL('libgdk-3-0.dll').gdk_win32_window_get_handle
+        gdk_win32_window_get_handle.restype = ctypes.c_void_p
+        gdk_win32_window_get_handle.argtypes = [ctypes.c_void_p]
+        _gdk_win32_window_get_handle = gdk_win32_window_get_handle
+
     # get the c gpointer of the gdk window
-    ctypes.pythonapi.PyCapsule_GetPointer.restype = ctypes.c_void_p
-    ctypes.pythonapi.PyCapsule_GetPointer.argtypes = [ctypes.py_object]
-    drawingarea_gpointer = ctypes.pythonapi.PyCapsule_GetPointer(window.__gpointer__, None)
+    drawingarea_gpointer = _PyCapsule_GetPointer(window.__gpointer__, None)
     # get the win32 handle
-    gdkdll = ctypes.CDLL('libgdk-3-0.dll')
-    return gdkdll.gdk_win32_window_get_handle(drawingarea_gpointer)
+    return _gdk_win32_window_get_handle(drawingarea_gpointer)
 
 
 class VideoOverlay(builder.Builder):
@@ -93,6 +109,10 @@ class VideoOverlay(builder.Builder):
     relative_page_margins = None
     #: `tuple` containing the left/top/right/bottom space around the drawing area in the visible slide
     relative_margins = None
+    #: `bool` indicating whether all :attr:`~relative_margins` are non-negative, i.e. whether the media can be shown
+    margins_valid = True
+    #: `tuple` of the parent size and relative margins used by the last :meth:`~resize`, to skip identical resizes
+    last_resize_key = None
     #: `bool` that tracks whether we should play automatically
     autoplay = False
 
@@ -113,12 +133,22 @@ class VideoOverlay(builder.Builder):
     time_format = '{:01}:{:02}'
     #: `float` holding the max time in s
     maxval = 1
+    #: `float` holding the latest position requested by moving the progress bar, not yet sent to the player
+    pending_seek = None
+    #: `int` source id of the timeout that sends :attr:`~pending_seek` to the player, or 0 if none is scheduled
+    seek_timeout = 0
+    #: `int` number of seconds last formatted by :meth:`~format_millis`, or -1 if invalidated
+    last_formatted_sec = -1
+    #: `str` last result of :meth:`~format_millis`, valid as long as the time in seconds does not change
+    last_formatted_str = ''
+    #: `int` number of seconds at which the progress bar was last updated by :meth:`~update_progress`
+    last_progress_sec = -1
 
     def __init__(self, container, show_controls, relative_margins, page_type, callback_getter):
         super(VideoOverlay, self).__init__()
 
         self.parent = container
-        self.relative_page_margins = tuple(getattr(relative_margins, v) for v in ('x1', 'y2', 'x2', 'y1'))
+        self.relative_page_margins = (relative_margins.x1, relative_margins.y2, relative_margins.x2, relative_margins.y1)
         self.update_margins_for_page(page_type)
 
         self.load_ui('media_overlay')
@@ -144,7 +174,11 @@ class VideoOverlay(builder.Builder):
             sc (:class:`~Gtk.Scale`): The scale whose position we are formatting
             prog (`float`): The position of the :class:`~Gtk.Scale`, i.e. the number of seconds elapsed
         """
-        return self.time_format.format(*divmod(int(round(prog)), 60))
+        sec = int(round(prog))
+        if sec != self.last_formatted_sec:
+            self.last_formatted_sec = sec
+            self.last_formatted_str = self.time_format.format(*divmod(sec, 60))
+        return self.last_formatted_str
 
 
     def update_range(self, max_time):
@@ -158,6 +192,8 @@ class VideoOverlay(builder.Builder):
         self.progress.set_increments(min(5., self.maxval / 10.), min(60., self.maxval / 10.))
         sec = round(self.maxval) if self.maxval > .5 else 1.
         self.time_format = '{{:01}}:{{:02}} / {:01}:{:02}'.format(*divmod(int(sec), 60))
+        # invalidate the memoised time string, since its format changed
+        self.last_formatted_sec = -1
 
 
     def update_progress(self, time):
@@ -166,18 +202,41 @@ class VideoOverlay(builder.Builder):
         Args:
             time (`float`): The time in this video in s
         """
-        self.progress.set_value(time)
+        # The progress bar only displays seconds, so skip updates within the same second
+        sec = int(round(time))
+        if sec != self.last_progress_sec:
+            self.last_progress_sec = sec
+            self.progress.set_value(time)
 
 
     def progress_moved(self, rng, sc, val):
         """ Callback to update the position of the video when the user moved the progress bar.
 
+        Seeking is throttled: positions are sent to the player at most every 80ms, e.g. while dragging the slider.
+
         Args:
             rng (:class:`~Gtk.Range`): The range corresponding to the scale whose position we are formatting
-            sc (:class:`~Gtk.Scale`): The scale whose position we are updating
+            sc (:class:`~Gtk.ScrollType`): The type of scroll action that moved the scale, unused
             val (`float`): The position of the :class:`~Gtk.Scale`, which is the number of seconds elapsed in the video
+
+        Returns:
+            `bool`: whether the event was consumed
+        """
+        self.pending_seek = val
+        if not self.seek_timeout:
+            self.seek_timeout = GLib.timeout_add(80, self.flush_seek)
+        return False
+
+
+    def flush_seek(self):
+        """ Send the latest position requested by moving the progress bar to the player. Called via GLib.timeout_add
+
+        Returns:
+            `bool`: `True` iff this function should be run again (:func:`~GLib.timeout_add` convention)
         """
-        return self.set_time(val)
+        self.seek_timeout = 0
+        self.set_time(self.pending_seek)
+        return False
 
 
     def update_margins_for_page(self, page_type):
@@ -186,19 +245,30 @@ class VideoOverlay(builder.Builder):
             page_type (:class:`~pympress.document.PdfPage`): the part of the page to display
         """
         self.relative_margins = page_type.to_screen(*self.relative_page_margins)
+        left, top, right, bottom = self.relative_margins
+        self.margins_valid = left >= 0 and top >= 0 and right >= 0 and bottom >= 0
+        self.last_resize_key = None
 
 
-    def resize(self):
+    def resize(self, force = False):
         """ Adjust the position and size of the media overlay.
+
+        Args:
+            force (`bool`): `True` if the overlay is known to be shown, to skip checking it
         """
-        if not self.is_shown():
+        if not force and not self.is_shown():
             return
 
         pw, ph = self.parent.get_allocated_width(), self.parent.get_allocated_height()
-        self.media_overlay.props.margin_left   = pw * self.relative_margins[0]
-        self.media_overlay.props.margin_right  = pw * self.relative_margins[2]
-        self.media_overlay.props.margin_bottom = ph * self.relative_margins[3]
-        self.media_overlay.props.margin_top    = ph * self.relative_margins[1]
+        key = (pw, ph, self.relative_margins)
+        if key == self.last_resize_key:
+            return
+        self.last_resize_key = key
+
+        left, top, right, bottom = self.relative_margins
+        # set all (integer) margins at once, so notifications are emitted together when the properties are thawed
+        self.media_overlay.set_properties(margin_left = int(pw * left), margin_right = int(pw * right),
+                                          margin_bottom = int(ph * bottom), margin_top = int(ph * top))
 
 
     def is_shown(self):
@@ -237,14 +307,14 @@ class VideoOverlay(builder.Builder):
     def show(self):
         """ Bring the widget to the top of the overlays if necessary.
         """
-        if min(self.relative_margins) < 0:
+        if not self.margins_valid:
             logger.warning('Not showing media with (some) negative margin(s): LTRB = {}'.format(self.relative_margins))
             return
 
-        if not self.media_overlay.get_parent():
+        if self.media_overlay.get_parent() is None:
             self.parent.add_overlay(self.media_overlay)
             self.parent.reorder_overlay(self.media_overlay, 2)
-            self.resize()
+            self.resize(force = True)
             self.parent.queue_draw()
         self.media_overlay.show()
 
@@ -255,6 +325,12 @@ class VideoOverlay(builder.Builder):
         Returns:
             `bool`: `True` iff this function should be run again (:func:`~GLib.idle_add` convention)
         """
+        if self.seek_timeout:
+            # drop the seek pending from dragging the progress bar, the player is being stopped
+            GLib.source_remove(self.seek_timeout)
+            self.seek_timeout = 0
+            self.pending_seek = None
+
         self.do_stop()
         self.media_overlay.hide()
 
@@ -30,8 +30,9 @@ import logging
 logger = logging.getLogger(__name__)
 
 import gi
+import cairo
 gi.require_version('Gtk', '3.0')
-from gi.repository import Gdk, GdkPixbuf
+from gi.repository import Gdk, GdkPixbuf, GLib
 
 from pympress import util, extras
 
@@ -48,6 +49,11 @@ POINTERMODE_MANUAL = 0
 #: Pointer never switched on
 POINTERMODE_DISABLED = -1
 
+# Gdk values used when handling every click on a slide, looked up once through introspection
+_CTRL_MASK = Gdk.ModifierType.CONTROL_MASK
+_BUTTON_PRESS = Gdk.EventType.BUTTON_PRESS
+_BUTTON_RELEASE = Gdk.EventType.BUTTON_RELEASE
+
 
 
 class Pointer(object):
@@ -67,10 +73,18 @@ class Pointer(object):
     c_da     = None
     #: :class:`~Gtk.AspectFrame` Frame of the Contents window, used to reliably set cursors.
     c_frame  = None
+    #: :class:`~Gtk.DrawingArea` Slide in the Presenter window when highlighting, on which the pointer is also drawn.
+    scribble_p_da = None
+    #: `bool` indicating a call to :meth:`~do_redraw` is scheduled in the main loop's idle time
+    redraw_scheduled = False
     #: `str` Remeber old pointermode in toggling
     old_pointermode = None
     #: :class:`~pympress.builder.Builder`): A builder from which to load widgets
     builder = None
+    #: `dict` of :class:`~GdkPixbuf.Pixbuf` already loaded, by pointer color name, shared across instances
+    _pixbuf_cache = {}
+    #: :class:`~cairo.ImageSurface` with the current :attr:`~pointer` painted into it, ready to be blitted
+    _pointer_surface = None
 
 
     #: callback, to be connected to :func:`~pympress.ui.UI.redraw_current_slide`
@@ -88,6 +102,14 @@ class Pointer(object):
         self.builder = builder
 
         builder.load_widgets(self)
+        # the highlighting slide is loaded by the scribbler's own builder
+        self.scribble_p_da = builder.scribbler.scribble_p_da
+
+        #: `dict` of `(float, float)` tuples, the inverse of each slide widget's allocated width and height
+        self.inverse_sizes = {}
+
+        for widget in [self.c_da, self.p_da_cur, self.scribble_p_da]:
+            widget.connect('size-allocate', self.on_size_allocate)
 
         self.redraw_current_slide = builder.get_callback_handler('redraw_current_slide')
 
@@ -102,20 +124,21 @@ class Pointer(object):
             self.config.set('presenter', 'pointer_mode', 'none')
 
         self.activate_pointermode(default_mode)
-
-        for radio_name in ['pointermode_continuous', 'pointermode_manual', 'pointermode_none']:
-            radio = builder.get_object(radio_name)
-            radio.set_name(radio_name)
-
-            radio.set_active(radio_name == 'pointermode_' + default_mode)
-
         self.load_pointer(default_color)
 
-        for radio_name in ['pointer_red', 'pointer_blue', 'pointer_green']:
+        #: `dict` of the :class:`~Gtk.RadioMenuItem` to select pointer modes and colors, by name
+        self.radio_items = {}
+        for radio_name in ['pointermode_continuous', 'pointermode_manual', 'pointermode_none',
+                           'pointer_red', 'pointer_blue', 'pointer_green']:
             radio = builder.get_object(radio_name)
             radio.set_name(radio_name)
+            self.radio_items[radio_name] = radio
 
-            radio.set_active(radio_name == default_color)
+        # Activating an item deactivates the others in its radio group. Unknown modes from the config activate nothing.
+        mode_radio = self.radio_items.get('pointermode_' + default_mode)
+        if mode_radio is not None:
+            mode_radio.set_active(True)
+        self.radio_items[default_color].set_active(True)
 
 
     def load_pointer(self, name):
@@ -124,11 +147,16 @@ class Pointer(object):
         Args:
             name (`str`): Name of the pointer to load
         """
-        if name in ['pointer_red', 'pointer_green', 'pointer_blue']:
-            self.pointer = GdkPixbuf.Pixbuf.new_from_file(util.get_icon_path(name + '.png'))
-        else:
+        if name not in ['pointer_red', 'pointer_green', 'pointer_blue']:
             raise ValueError('Wrong color name')
 
+        pb = self._pixbuf_cache.get(name)
+        if pb is None:
+            pb = GdkPixbuf.Pixbuf.new_from_file(util.get_icon_path(name + '.png'))
+            self._pixbuf_cache[name] = pb
+        self.pointer = pb
+        self._pointer_surface = None
+
 
     def change_pointer(self, widget):
         """ Callback for a radio item selection as pointer color
@@ -204,9 +232,19 @@ class Pointer(object):
             mode = 'continuous'
 
         self.activate_pointermode(mode)
-        self.builder.get_object('pointermode_'+mode).set_active(True)
+        self.radio_items['pointermode_' + mode].set_active(True)
             
 
+    def on_size_allocate(self, widget, allocation):
+        """ Callback for the size-allocate signal of slide widgets, to store the inverse of the widget's size
+
+        Args:
+            widget (:class:`~Gtk.Widget`):  the widget which has been resized
+            allocation (:class:`~Gdk.Rectangle`):  the widget's new allocated size
+        """
+        self.inverse_sizes[widget] = (1. / max(1, allocation.width), 1. / max(1, allocation.height))
+
+
     def render_pointer(self, cairo_context, ww, wh):
         """ Draw the laser pointer on screen
 
@@ -216,9 +254,17 @@ class Pointer(object):
             wh (`int`): The widget height
         """
         if self.show_pointer == POINTER_SHOW:
-            x = ww * self.pointer_pos[0] - self.pointer.get_width() / 2
-            y = wh * self.pointer_pos[1] - self.pointer.get_height() / 2
-            Gdk.cairo_set_source_pixbuf(cairo_context, self.pointer, x, y)
+            if self._pointer_surface is None:
+                # Convert the pixbuf once, instead of uploading it as a cairo source on every draw
+                pw, ph = self.pointer.get_width(), self.pointer.get_height()
+                self._pointer_surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, pw, ph)
+                surface_context = cairo.Context(self._pointer_surface)
+                Gdk.cairo_set_source_pixbuf(surface_context, self.pointer, 0, 0)
+                surface_context.paint()
+
+            x = ww * self.pointer_pos[0] - self._pointer_surface.get_width() / 2
+            y = wh * self.pointer_pos[1] - self._pointer_surface.get_height() / 2
+            cairo_context.set_source_surface(self._pointer_surface, x, y)
             cairo_context.paint()
 
 
@@ -233,15 +279,42 @@ class Pointer(object):
             `bool`: whether the event was consumed
         """
         if self.show_pointer == POINTER_SHOW:
-            ww, wh = widget.get_allocated_width(), widget.get_allocated_height()
+            try:
+                inv_ww, inv_wh = self.inverse_sizes[widget]
+            except KeyError:
+                inv_ww, inv_wh = 1. / widget.get_allocated_width(), 1. / widget.get_allocated_height()
+
             ex, ey = event.get_coords()
-            self.pointer_pos = (ex / ww, ey / wh)
-            self.redraw_current_slide()
+            self.pointer_pos = (ex * inv_ww, ey * inv_wh)
+
+            self.schedule_redraw()
             return True
 
         else:
             return False
 
+
+    def schedule_redraw(self):
+        """ Request a redraw of the current slides at the next idle time of the main loop, unless one is already scheduled
+
+        The high idle priority runs it before GDK's redraws, so the pointer moves in the frame being drawn.
+        """
+        if not self.redraw_scheduled:
+            self.redraw_scheduled = True
+            GLib.idle_add(self.do_redraw, priority = GLib.PRIORITY_HIGH_IDLE)
+
+
+    def do_redraw(self):
+        """ Redraw the current slides. Needs to be called via GLib.idle_add, see :meth:`~schedule_redraw`
+
+        Returns:
+            `bool`: `True` iff this function should be run again (:func:`~GLib.idle_add` convention)
+        """
+        self.redraw_scheduled = False
+        self.redraw_current_slide()
+        return False
+
+
     def track_enter_leave(self, widget, event):
         """ Switches laser off/on in continuous mode on leave/enter slides
 
@@ -328,16 +401,16 @@ class Pointer(object):
         if self.pointer_mode == POINTERMODE_CONTINUOUS:
             return False
 
-        ctrl_pressed = event.get_state() & Gdk.ModifierType.CONTROL_MASK
+        ctrl_pressed = bool(event.get_state() & _CTRL_MASK)
 
-        if ctrl_pressed and event.type == Gdk.EventType.BUTTON_PRESS:
+        if ctrl_pressed and event.type == _BUTTON_PRESS:
             self.show_pointer = POINTER_SHOW
             extras.Cursor.set_cursor(widget, 'invisible')
 
             # Immediately place & draw the pointer
             return self.track_pointer(widget, event)
 
-        elif self.show_pointer == POINTER_SHOW and event.type == Gdk.EventType.BUTTON_RELEASE:
+        elif self.show_pointer == POINTER_SHOW and event.type == _BUTTON_RELEASE:
             self.show_pointer = POINTER_HIDE
             extras.Cursor.set_cursor(widget, 'parent')
             self.redraw_current_slide()
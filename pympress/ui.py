@@ -857,7 +857,8 @@ class UI(builder.Builder):
 
             cairo_context.restore()
 
-        if widget is self.c_da or widget is self.p_da_cur or widget is self.scribbler.scribble_p_da:
+        if self.laser.pointer_mode != pointer.POINTERMODE_DISABLED and (widget is self.c_da or widget is self.p_da_cur
+                                                                       or widget is self.scribbler.scribble_p_da):
             # do not use the zoom matrix for the pointer, it is relative to the screen not the slide
             self.laser.render_pointer(cairo_context, ww, wh)
 